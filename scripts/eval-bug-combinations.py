@@ -1,7 +1,6 @@
 #!/usr/bin/env python3
 
 import argparse
-import glob
 import os
 import threading
 
@@ -35,9 +34,7 @@ def main():
         os.makedirs(bug_combination_outdir, exist_ok=True)
 
         # collect reports
-        reports = glob.glob(
-            '{}/TARGET-{}-*.report.bin.zst'.format(args.corpus, target.replace('/', '-')))
-        reports.sort()
+        reports = collect_reports(args.corpus, target)
 
         for i, report in enumerate(reports):
             outfile = os.path.join(
@@ -57,9 +54,12 @@ def main():
 
 
 def crash_time(workloads, max):
-    while len(workloads) > 0:
+    while True:
         # next target
-        report, outpath = workloads.pop(0)
+        try:
+            report, outpath = workloads.pop(0)
+        except IndexError:
+            break
         eprint('run', max - len(workloads), '/', max, ':', report)
 
         with open(outpath, "w") as f:
@@ -1,7 +1,6 @@
 #!/usr/bin/env python3
 
 import argparse
-import glob
 import os
 from pathlib import Path
 import threading
@@ -26,8 +25,7 @@ def main():
     # runs
     runs = []
     for target in args.targets:
-        target_filename = target.replace('/', '-')
-        for report in corpus.glob(f'TARGET-{target_filename}-*.report.bin.zst'):
+        for report in collect_reports(corpus, target):
             runs.append((target, report))
     max = len(runs)
 
@@ -45,8 +43,11 @@ def main():
 
 
 def run_executions(output, corpus, runs, max):
-    while len(runs) > 0:
-        (target, report) = runs.pop(0)
+    while True:
+        try:
+            (target, report) = runs.pop(0)
+        except IndexError:
+            break
 
         eprint('run', max - len(runs), '/', max, ':', corpus)
 
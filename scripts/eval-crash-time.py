@@ -1,7 +1,6 @@
 #!/usr/bin/env python3
 
 import argparse
-import glob
 import json
 import os
 import threading
@@ -100,15 +99,16 @@ def crash_time(corpus, include_non_crashing_inputs, exclude_unknown_crashes, tim
     if include_non_crashing_inputs:
         args = ['--include-non-crashing-inputs']
 
-    while len(targets) > 0:
+    while True:
         # next target
-        target = targets.pop(0)
+        try:
+            target = targets.pop(0)
+        except IndexError:
+            break
         eprint('run', max - len(targets), '/', max, ':', target)
 
         # collect reports
-        reports = glob.glob(
-            '{}/TARGET-{}-*.report.bin.zst'.format(corpus, target.replace('/', '-')))
-        reports.sort()
+        reports = collect_reports(corpus, target)
 
         target_timing = []
         for report in reports:
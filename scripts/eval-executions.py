@@ -1,7 +1,6 @@
 #!/usr/bin/env python3
 
 import argparse
-import glob
 import os
 from pathlib import Path
 import threading
@@ -27,8 +26,7 @@ def main():
     # runs
     runs = []
     for target in args.targets:
-        target_filename = target.replace('/', '-')
-        for report in corpus.glob(f'TARGET-{target_filename}-*.report.bin.zst'):
+        for report in collect_reports(corpus, target):
             runs.append((corpus, report))
     max = len(runs)
 
@@ -47,9 +45,7 @@ def main():
     summary = open(args.summary, 'w')
     for target in args.targets:
         # collect executions files
-        target_filename = target.replace('/', '-')
-        executions = glob.glob(f'{output}/TARGET-{target_filename}-*.txt')
-        executions.sort()
+        executions = collect_target_files(output, target, '.txt')
 
         # total executions + duration
         total_executions = 0
@@ -80,8 +76,11 @@ def main():
 
 
 def run_executions(output, runs, max):
-    while len(runs) > 0:
-        (corpus, report) = runs.pop(0)
+    while True:
+        try:
+            (corpus, report) = runs.pop(0)
+        except IndexError:
+            break
 
         eprint('run', max - len(runs), '/', max, ':', corpus)
 
@@ -1,7 +1,6 @@
 #!/usr/bin/env python3
 
 import argparse
-import glob
 import os
 import threading
 
@@ -39,15 +38,16 @@ def main():
 
 
 def merge_report(corpus, group_size, output_dir, targets, max):
-    while len(targets) > 0:
+    while True:
         # next
-        target = targets.pop(0)
+        try:
+            target = targets.pop(0)
+        except IndexError:
+            break
         eprint('run', max - len(targets), '/', max, ':', target)
 
         # collect reports
-        reports = glob.glob(
-            '{}/TARGET-{}-*.report.bin.zst'.format(corpus, target.replace('/', '-')))
-        reports.sort()
+        reports = collect_reports(corpus, target)
 
         # verify count
         remainder = len(reports) % group_size
@@ -1,7 +1,6 @@
 #!/usr/bin/env python3
 
 import argparse
-import glob
 import os
 import threading
 from pathlib import Path
@@ -44,7 +43,7 @@ def main():
     runs = []
     for target in args.targets:
         target_filename = target.replace('/', '-')
-        for report in glob.glob('{}/TARGET-{}-*.report.bin.zst'.format(corpus, target_filename)):
+        for report in collect_reports(corpus, target):
             runs.append((corpus, report, target, target_filename))
     max = len(runs)
 
@@ -64,8 +63,11 @@ def main():
 
 
 def run_coverage_list(runs, no_basic_block_filter, output, config_name, bug_filter, max):
-    while len(runs) > 0:
-        (corpus, report, target, target_filename) = runs.pop(0)
+    while True:
+        try:
+            (corpus, report, target, target_filename) = runs.pop(0)
+        except IndexError:
+            break
 
         eprint('run', max - len(runs), '/', max, ':', corpus, target_filename)
 
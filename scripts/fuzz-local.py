@@ -53,12 +53,11 @@ def local_runner(core, cores, fuzz_runs, max):
             time.sleep(30)
             continue
 
-        # recheck to decrease race condition
-        if len(fuzz_runs) < 1:
+        # do next fuzzing run (list may be drained by another thread)
+        try:
+            fuzz_args = fuzz_runs.pop(0)
+        except IndexError:
             break
-
-        # do next fuzzing run
-        fuzz_args = fuzz_runs.pop(0)
         print(core, 'run', max - len(fuzz_runs), '/', max, ':', fuzz_args)
         try:
             do_fuzzer_run(*fuzz_args)
@@ -117,6 +116,11 @@ def do_local_fuzzer_run(cores, name, targets, runs, fuzzers, modes, duration, tr
                     )
     max = len(fuzz_runs)
 
+    # build fuzzers once (instead of per core thread)
+    init()
+    for fuzzer in fuzzers:
+        build_hoedur(fuzzer)
+
     # start thread per core
     threads = []
 
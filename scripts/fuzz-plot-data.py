@@ -64,7 +64,7 @@ def main():
     runs = []
     for target in args.targets:
         target_filename = target.replace('/', '-')
-        for report in corpus.glob(f'TARGET-{target_filename}-*.report.bin.zst'):
+        for report in collect_reports(corpus, target):
             runs.append((corpus, report, target, target_filename))
     max = len(runs)
 
@@ -85,8 +85,11 @@ def main():
 
 
 def run_plot_data(config_name, output, root, no_basic_block_filter, only_coverage, bug_filter, plot, runs, max):
-    while len(runs) > 0:
-        (corpus, report, target, target_filename) = runs.pop(0)
+    while True:
+        try:
+            (corpus, report, target, target_filename) = runs.pop(0)
+        except IndexError:
+            break
 
         eprint('run', max - len(runs), '/', max, ':', corpus, target_filename)
 
@@ -6,6 +6,7 @@ import psutil
 import subprocess
 import sys
 import threading
+from pathlib import Path
 
 
 def env(var, default=None):
@@ -22,6 +23,13 @@ HOEDUR_FUZZER_CONFIG = env('HOEDUR_FUZZER_CONFIG',
                            CODE + '/hoedur-fuzzer-config')
 CONFIG_FILE = env('CONFIG_FILE', 'config.yml')
 MODELS_FILE = env('MODELS_FILE', 'models.yml.zst')
+HOEDUR_CORES = env('HOEDUR_CORES')
+
+# validate core override once (before any build / argparse default)
+try:
+    HOEDUR_CORES = HOEDUR_CORES and max(1, int(HOEDUR_CORES))
+except ValueError:
+    sys.exit(f'ERROR: HOEDUR_CORES is not a number: {HOEDUR_CORES}')
 
 FUZZER = {
     'hoedur': f'{HOEDUR_BIN}-{HOEDUR_ARCH}',
@@ -32,6 +40,7 @@ FUZZER = {
 MODES = ['plain', 'models', 'fuzzware']
 
 BUILD_MUTEX = threading.Lock()
+BUILT = set()
 
 
 def init():
@@ -40,7 +49,19 @@ def init():
 
 
 def cpu_cores(logical=True):
-    return psutil.cpu_count(logical=logical)
+    # user override for logical cores (worker threads of eval scripts)
+    if logical and HOEDUR_CORES:
+        return HOEDUR_CORES
+
+    # respect cpu affinity / cgroup cpuset (e.g. in docker container)
+    available = len(os.sched_getaffinity(0))
+    if logical:
+        return available
+
+    # approximate physical cores in affinity mask (assumes even SMT spread)
+    physical = psutil.cpu_count(logical=False) or available
+    total = psutil.cpu_count(logical=True) or available
+    return min(max(1, physical * available // total), available)
 
 
 def eprint(*args, **kwargs):
@@ -49,23 +70,26 @@ def eprint(*args, **kwargs):
 
 def build(binary, crate='hoedur-analyze', force_build=False):
     global BUILD_MUTEX
-    BUILD_MUTEX.acquire()
-
-    # check if binary is available (e.g. in hoedur docker container)
-    if not force_build:
-        try:
-            subprocess.check_call([binary, '--help'],
-                                  stdout=subprocess.DEVNULL)
-        except:
-            force_build = True
-
-    # build binary
-    if force_build:
-        run([
-            'cargo', 'install', '--path', crate, '--bin', binary
-        ])
-
-    BUILD_MUTEX.release()
+    with BUILD_MUTEX:
+        # binary was already checked / built by this process
+        if binary in BUILT and not force_build:
+            return False
+
+        # check if binary is available (e.g. in hoedur docker container)
+        if not force_build:
+            try:
+                subprocess.check_call([binary, '--help'],
+                                      stdout=subprocess.DEVNULL)
+                BUILT.add(binary)
+            except:
+                force_build = True
+
+        # build binary
+        if force_build:
+            if run([
+                'cargo', 'install', '--path', crate, '--bin', binary
+            ]) == 0:
+                BUILT.add(binary)
 
     return force_build
 
@@ -116,6 +140,32 @@ def run(cmd, log=None, logfile=None, timeout=None, **kwargs):
         raise e
 
 
+def collect_target_files(path, target, suffix):
+    prefix = 'TARGET-{}-'.format(target.replace('/', '-'))
+
+    # missing dir matches nothing (like glob)
+    if not os.path.isdir(path):
+        return []
+
+    # literal prefix / suffix match (no glob pattern from path or target)
+    with os.scandir(path) as entries:
+        files = [
+            entry.path for entry in entries
+            if entry.name.startswith(prefix) and entry.name.endswith(suffix)
+        ]
+    files.sort()
+
+    # same path type as the given dir (str or Path)
+    if isinstance(path, Path):
+        files = [Path(file) for file in files]
+
+    return files
+
+
+def collect_reports(corpus, target):
+    return collect_target_files(corpus, target, '.report.bin.zst')
+
+
 def parse_duration(value):
     if 's' in value:
         value = int(value.rstrip('s'))